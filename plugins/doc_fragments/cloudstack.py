@@ -48,6 +48,14 @@ options:
       - Verify CA authority cert file.
       - If not given, the C(CLOUDSTACK_VERIFY) env variable is considered.
     type: str
+  poll_timeout:
+    description:
+      - Time in seconds to wait for an async job to finish before failing.
+      - A value of C(0) or less waits without a time limit.
+      - If not given, the C(CLOUDSTACK_POLL_TIMEOUT) env variable is considered.
+    type: int
+    default: 3600
+    version_added: 2.4.0
 requirements:
   - python >= 2.6
   - cs >= 0.9.0
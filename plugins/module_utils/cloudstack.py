@@ -35,6 +35,7 @@ def cs_argument_spec():
         api_http_method=dict(type='str', fallback=(env_fallback, ['CLOUDSTACK_METHOD']), choices=['get', 'post'], default='get'),
         api_timeout=dict(type='int', fallback=(env_fallback, ['CLOUDSTACK_TIMEOUT']), default=10),
         api_verify_ssl_cert=dict(type='str', fallback=(env_fallback, ['CLOUDSTACK_VERIFY'])),
+        poll_timeout=dict(type='int', fallback=(env_fallback, ['CLOUDSTACK_POLL_TIMEOUT']), default=3600),
     )
 
 
@@ -458,7 +459,7 @@ class AnsibleCloudStack:
                     return self._get_by_key(key, d)
         self.fail_json(msg="Disk offering '%s' not found" % disk_offering)
 
-    def get_zone(self, key=None):
+    def get_zone(self, key=None, fail_on_missing=True):
         if self.zone:
             return self._get_by_key(key, self.zone)
 
@@ -467,7 +468,7 @@ class AnsibleCloudStack:
             zone = os.environ.get('CLOUDSTACK_ZONE')
         zones = self.query_api('listZones')
 
-        if not zones:
+        if not zones and fail_on_missing:
             self.fail_json(msg="No zones available. Please create a zone first")
 
         # this check is theoretically not required, as module argument specification should take care of it
@@ -483,7 +484,9 @@ class AnsibleCloudStack:
                     self.result['zone'] = z['name']
                     self.zone = z
                     return self._get_by_key(key, self.zone)
-        self.fail_json(msg="zone '%s' not found" % zone)
+        if fail_on_missing:
+            self.fail_json(msg="zone '%s' not found" % zone)
+        return None
 
     def get_os_type(self, key=None):
         if self.os_type:
@@ -625,6 +628,11 @@ class AnsibleCloudStack:
 
     def poll_job(self, job=None, key=None):
         if 'jobid' in job:
+            poll_interval = 2
+            poll_timeout = self.module.params.get('poll_timeout')
+            poll_deadline = None
+            if poll_timeout and poll_timeout > 0:
+                poll_deadline = time.time() + poll_timeout
             while True:
                 res = self.query_api('queryAsyncJobResult', jobid=job['jobid'])
                 if res['jobstatus'] != 0 and 'jobresult' in res:
@@ -636,7 +644,13 @@ class AnsibleCloudStack:
                         job = res['jobresult'][key]
 
                     break
-                time.sleep(2)
+
+                if poll_deadline and time.time() >= poll_deadline:
+                    self.fail_json(msg="Timed out waiting for job %s" % job['jobid'])
+
+                time.sleep(poll_interval)
+                # Back off on long running jobs to spare the API
+                poll_interval = min(poll_interval * 1.5, 30)
         return job
 
     def update_result(self, resource, result=None):
@@ -234,17 +234,15 @@ class AnsibleCloudStackCluster(AnsibleCloudStack):
 
     def get_cluster(self):
         if not self.cluster:
-            args = {}
+            # Do not fail if the zone does not exist (anymore), the cluster can't exist either.
+            zone_id = self.get_zone(key='id', fail_on_missing=False)
+            if not zone_id:
+                return None
 
-            uuid = self.module.params.get('id')
-            if uuid:
-                args['id'] = uuid
-                clusters = self.query_api('listClusters', **args)
-                if clusters:
-                    self.cluster = clusters['cluster'][0]
-                    return self.cluster
-
-            args['name'] = self.module.params.get('name')
+            args = {
+                'name': self.module.params.get('name'),
+                'zoneid': zone_id,
+            }
             clusters = self.query_api('listClusters', **args)
             if clusters:
                 self.cluster = clusters['cluster'][0]
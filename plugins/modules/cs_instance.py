@@ -460,7 +460,13 @@ class AnsibleCloudStackInstance(AnsibleCloudStack):
     def get_service_offering_id(self):
         service_offering = self.module.params.get('service_offering')
 
-        service_offerings = self.query_api('listServiceOfferings')
+        # Let the API filter by name, fall back to a full listing e.g. if an ID was given.
+        # Filtering by an unknown ID is rejected by the API instead of returning an empty list.
+        service_offerings = None
+        if service_offering:
+            service_offerings = self.query_api('listServiceOfferings', name=service_offering)
+        if not service_offerings:
+            service_offerings = self.query_api('listServiceOfferings')
         if service_offerings:
             if not service_offering:
                 return service_offerings['serviceoffering'][0]['id']
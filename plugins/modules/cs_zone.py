@@ -268,12 +268,9 @@ class AnsibleCloudStackZone(AnsibleCloudStack):
             uuid = self.module.params.get('id')
             if uuid:
                 args['id'] = uuid
-                zones = self.query_api('listZones', **args)
-                if zones:
-                    self.zone = zones['zone'][0]
-                    return self.zone
+            else:
+                args['name'] = self.module.params.get('name')
 
-            args['name'] = self.module.params.get('name')
             zones = self.query_api('listZones', **args)
             if zones:
                 self.zone = zones['zone'][0]
@@ -0,0 +1,94 @@
+from __future__ import (absolute_import, division, print_function)
+import pytest
+
+try:
+    from unittest.mock import MagicMock, patch
+except ImportError:
+    from mock import MagicMock, patch
+
+from ansible_collections.ngine_io.cloudstack.plugins.module_utils.cloudstack import AnsibleCloudStack, HAS_LIB_CS
+
+__metaclass__ = type
+
+
+pytestmark = []
+if not HAS_LIB_CS:
+    pytestmark.append(pytest.mark.skip('The cloudstack library, "cs", is needed to test AnsibleCloudStack'))
+
+
+class FailJsonException(Exception):
+    pass
+
+
+PENDING_JOB_RESPONSE = {
+    "jobid": "3f08b6a2-4f8e-4a6b-b0b9-8ea0b4c0e1a5",
+    "jobstatus": 0,
+}
+
+DONE_JOB_RESPONSE = {
+    "jobid": "3f08b6a2-4f8e-4a6b-b0b9-8ea0b4c0e1a5",
+    "jobstatus": 1,
+    "jobresult": {
+        "virtualmachine": {
+            "id": "7e4c8b2d-93f1-4b3e-8d2e-2a5f1c6b9d10",
+            "name": "test-vm",
+        }
+    }
+}
+
+
+def _setup_cloudstack(poll_timeout=3600):
+    module = MagicMock()
+    module.params = {'poll_timeout': poll_timeout}
+    module.fail_json.side_effect = FailJsonException
+    return AnsibleCloudStack(module)
+
+
+@patch('ansible_collections.ngine_io.cloudstack.plugins.module_utils.cloudstack.time')
+def test_poll_job_backoff(mock_time):
+    mock_time.time.return_value = 0
+    acs = _setup_cloudstack()
+    acs.query_api = MagicMock(side_effect=[PENDING_JOB_RESPONSE] * 9 + [DONE_JOB_RESPONSE])
+
+    job = acs.poll_job({'jobid': PENDING_JOB_RESPONSE['jobid']}, 'virtualmachine')
+
+    assert job == DONE_JOB_RESPONSE['jobresult']['virtualmachine']
+    assert acs.query_api.call_count == 10
+    intervals = [call[0][0] for call in mock_time.sleep.call_args_list]
+    assert intervals == pytest.approx([2, 3, 4.5, 6.75, 10.125, 15.1875, 22.78125, 30, 30])
+
+
+@patch('ansible_collections.ngine_io.cloudstack.plugins.module_utils.cloudstack.time')
+def test_poll_job_timeout(mock_time):
+    mock_time.time.side_effect = [0, 5, 10, 15]
+    acs = _setup_cloudstack(poll_timeout=10)
+    acs.query_api = MagicMock(return_value=PENDING_JOB_RESPONSE)
+
+    with pytest.raises(FailJsonException):
+        acs.poll_job({'jobid': PENDING_JOB_RESPONSE['jobid']}, 'virtualmachine')
+
+    assert mock_time.sleep.call_count == 1
+    assert acs.result['msg'] == "Timed out waiting for job %s" % PENDING_JOB_RESPONSE['jobid']
+
+
+@pytest.mark.parametrize('poll_timeout', [None, 0, -1])
+@patch('ansible_collections.ngine_io.cloudstack.plugins.module_utils.cloudstack.time')
+def test_poll_job_without_timeout(mock_time, poll_timeout):
+    mock_time.time.return_value = 0
+    acs = _setup_cloudstack(poll_timeout=poll_timeout)
+    acs.query_api = MagicMock(side_effect=[PENDING_JOB_RESPONSE] * 4 + [DONE_JOB_RESPONSE])
+
+    job = acs.poll_job({'jobid': PENDING_JOB_RESPONSE['jobid']}, 'virtualmachine')
+
+    assert job == DONE_JOB_RESPONSE['jobresult']['virtualmachine']
+    assert mock_time.sleep.call_count == 4
+    assert not mock_time.time.called
+
+
+def test_poll_job_without_jobid():
+    acs = _setup_cloudstack()
+    acs.query_api = MagicMock()
+
+    job = {'id': '7e4c8b2d-93f1-4b3e-8d2e-2a5f1c6b9d10'}
+    assert acs.poll_job(job, 'virtualmachine') == job
+    assert not acs.query_api.called
@@ -0,0 +1,102 @@
+from __future__ import (absolute_import, division, print_function)
+import pytest
+
+try:
+    from unittest.mock import MagicMock
+except ImportError:
+    from mock import MagicMock
+
+from ansible_collections.ngine_io.cloudstack.plugins.module_utils.cloudstack import HAS_LIB_CS
+from ansible_collections.ngine_io.cloudstack.plugins.modules.cs_cluster import AnsibleCloudStackCluster
+
+__metaclass__ = type
+
+
+pytestmark = []
+if not HAS_LIB_CS:
+    pytestmark.append(pytest.mark.skip('The cloudstack library, "cs", is needed to test cs_cluster'))
+
+
+class FailJsonException(Exception):
+    pass
+
+
+LIST_ZONES_RESPONSE = {
+    "count": 1,
+    "zone": [
+        {
+            "id": "49acf813-a8dd-4da0-aa53-1d826d6003e7",
+            "name": "zone-1",
+        }
+    ]
+}
+
+LIST_PODS_RESPONSE = {
+    "count": 1,
+    "pod": [
+        {
+            "id": "8d5b4a6e-5c7b-4f3a-9f0e-2b1c3d4e5f60",
+            "name": "pod-1",
+        }
+    ]
+}
+
+ADD_CLUSTER_RESPONSE = {
+    "cluster": [
+        {
+            "id": "1b4e28ba-2fa1-41d2-883f-0016d3cca427",
+            "name": "cluster-1",
+            "hypervisortype": "KVM",
+            "zonename": "zone-1",
+        }
+    ]
+}
+
+
+def _setup_cluster(**params):
+    module = MagicMock()
+    module.check_mode = False
+    module.params = {
+        'name': 'cluster-1',
+        'zone': 'zone-1',
+        'pod': 'pod-1',
+        'cluster_type': 'CloudManaged',
+        'hypervisor': 'KVM',
+        'state': 'present',
+    }
+    module.params.update(params)
+    module.fail_json.side_effect = FailJsonException
+    return AnsibleCloudStackCluster(module)
+
+
+def _api_calls(acs, command):
+    return [call for call in acs.query_api.call_args_list if call[0][0] == command]
+
+
+def test_absent_cluster_missing_zone():
+    acs = _setup_cluster(zone='zone-gone', state='absent')
+    acs.query_api = MagicMock(return_value=LIST_ZONES_RESPONSE)
+
+    assert acs.absent_cluster() is None
+    assert not acs.result['changed']
+    assert len(_api_calls(acs, 'listZones')) == 1
+    assert not _api_calls(acs, 'listClusters')
+
+
+def test_present_cluster_lists_zones_once():
+    responses = {
+        'listZones': LIST_ZONES_RESPONSE,
+        'listClusters': {},
+        'listPods': LIST_PODS_RESPONSE,
+        'addCluster': ADD_CLUSTER_RESPONSE,
+    }
+    acs = _setup_cluster()
+    acs.query_api = MagicMock(side_effect=lambda command, **args: responses[command])
+
+    cluster = acs.present_cluster()
+
+    assert cluster['id'] == ADD_CLUSTER_RESPONSE['cluster'][0]['id']
+    assert acs.result['changed']
+    assert len(_api_calls(acs, 'listZones')) == 1
+    list_clusters_args = _api_calls(acs, 'listClusters')[0][1]
+    assert list_clusters_args['zoneid'] == LIST_ZONES_RESPONSE['zone'][0]['id']